@@ -6,10 +6,12 @@ import statsmodels.api as sm
 import warnings
 import astropy.units as u
 from numpy.fft import fftshift
+from functools import lru_cache
 
 from .lm_seg import Lm_Seg
 from .psds import pspec, make_radial_freq_arrays
-from .fitting_utils import clip_func, residual_bootstrap
+from .fitting_utils import (clip_func, residual_bootstrap,
+                            fast_linear_fit)
 from .elliptical_powerlaw import (fit_elliptical_powerlaw,
                                   inverse_interval_transform,
                                   inverse_interval_transform_stderr)
@@ -17,6 +19,78 @@ from .apodizing_kernels import *
 from .rfft_to_fft import rfft_to_fft
 
 
+@lru_cache(maxsize=8)
+def _apod_kernel(shape, kernel_type, alpha, beta):
+    '''
+    Cached apodizing kernels. Data sets of the same shape (e.g., in the
+    distance metrics) share the same kernel. The returned array is read-only.
+    '''
+
+    avail_types = ['splitcosinebell', 'hanning', 'tukey',
+                   'cosinebell']
+
+    if kernel_type == "splitcosinebell":
+        window = SplitCosineBellWindow(alpha, beta)(shape)
+    elif kernel_type == "hanning":
+        window = HanningWindow()(shape)
+    elif kernel_type == "tukey":
+        window = TukeyWindow(alpha)(shape)
+    elif kernel_type == 'cosinebell':
+        window = CosineBellWindow(alpha)(shape)
+    else:
+        raise ValueError("kernel_type {0} is not one of the available "
+                         "types: {1}".format(kernel_type, avail_types))
+
+    window.flags.writeable = False
+
+    return window
+
+
+def _apply_apod_kernel(arr, apod_kernel):
+    '''
+    Multiply a temporary array by the apodizing kernel. The product is
+    written into `arr` when this does not change its type, otherwise a new
+    array is returned.
+    '''
+
+    if np.result_type(arr, apod_kernel) == arr.dtype:
+        arr *= apod_kernel
+        return arr
+
+    return arr * apod_kernel
+
+
+@lru_cache(maxsize=8)
+def _beam_pow(shape, major, minor, pa, pix_scale, keep_rfft=False):
+    '''
+    Cached power spectrum of the beam. The beam parameters and pixel scale
+    are given in deg. With `keep_rfft`, the unshifted half-plane from the
+    real FFT is returned. The returned array is read-only.
+    '''
+
+    from radio_beam import Beam
+
+    beam = Beam(major=major * u.deg, minor=minor * u.deg, pa=pa * u.deg)
+
+    beam_kern = beam.as_kernel(pix_scale * u.deg,
+                               y_size=shape[0],
+                               x_size=shape[1])
+
+    beam_fft = rfft_to_fft(beam_kern.array, keep_rfft=keep_rfft)
+
+    if not keep_rfft:
+        beam_fft = fftshift(beam_fft)
+
+    beam_pow = np.square(beam_fft, out=beam_fft)
+
+    # Avoid infs when dividing out by the beam power spectrum
+    beam_pow[beam_pow == 0.0] = np.NaN
+
+    beam_pow.flags.writeable = False
+
+    return beam_pow
+
+
 class StatisticBase_PSpec2D(object):
     """
     Common features shared by 2D power spectrum methods.
@@ -51,28 +125,38 @@ class StatisticBase_PSpec2D(object):
         '''
         return self._freqs
 
+    @property
+    def _ps2D_shape(self):
+        '''
+        Shape of the full two-dimensional power spectrum.
+        '''
+        return self._ps2D.shape
+
     @property
     def wavenumbers(self):
-        return self._freqs * min(self._ps2D.shape)
+        return self._freqs * self._min_shape
 
-    def compute_beam_pspec(self):
+    def compute_beam_pspec(self, keep_rfft=False):
         '''
         Compute the power spectrum of the beam element.
+
+        Parameters
+        ----------
+        keep_rfft : bool, optional
+            Return the unshifted half-plane of the beam power spectrum, for
+            dividing out of a half-plane power spectrum.
         '''
         if not hasattr(self, '_beam'):
             raise AttributeError("Beam correction cannot be applied since"
                                  " no beam object was given.")
 
-        beam_kern = self._beam.as_kernel(self._ang_size,
-                                         y_size=self._ps2D.shape[0],
-                                         x_size=self._ps2D.shape[1])
-
-        beam_fft = fftshift(rfft_to_fft(beam_kern.array))
-
-        self._beam_pow = np.abs(beam_fft**2)
-
-        # Avoid infs when dividing out by the beam power spectrum
-        self._beam_pow[self._beam_pow == 0.0] = np.NaN
+        self._beam_pow = \
+            _beam_pow(tuple(self._ps2D_shape),
+                      self._beam.major.to(u.deg).value,
+                      self._beam.minor.to(u.deg).value,
+                      self._beam.pa.to(u.deg).value,
+                      self._ang_size.to(u.deg).value,
+                      keep_rfft=keep_rfft)
 
     def compute_radial_pspec(self, logspacing=False, max_bin=None, **kwargs):
         '''
@@ -93,8 +177,22 @@ class StatisticBase_PSpec2D(object):
         else:
             azim_constraint_flag = False
 
-        out = pspec(self.ps2D, return_stddev=True,
-                    logspacing=logspacing, max_bin=max_bin, **kwargs)
+        # Average over the half-plane from the real FFT when it is available.
+        # Azimuthal masks, bootstrapping and other averaging functions need
+        # the full spectrum.
+        use_rfft = hasattr(self, "_ps2D_rfft") and \
+            kwargs.get("theta_0") is None and \
+            kwargs.get("boot_iter") is None and \
+            kwargs.get("mean_func", np.nanmean) is np.nanmean and \
+            kwargs.get("return_freqs", True)
+
+        if use_rfft:
+            out = pspec(self._ps2D_rfft, return_stddev=True,
+                        logspacing=logspacing, max_bin=max_bin,
+                        rfft_shape=self._ps2D_shape, **kwargs)
+        else:
+            out = pspec(self.ps2D, return_stddev=True,
+                        logspacing=logspacing, max_bin=max_bin, **kwargs)
 
         self._azim_constraint_flag = azim_constraint_flag
 
@@ -106,10 +204,20 @@ class StatisticBase_PSpec2D(object):
         # Attach units to freqs
         self._freqs = self.freqs / u.pix
 
+        # Shape limits used for wavenumbers and the default fit limits
+        self._min_shape = min(self._ps2D_shape)
+        self._max_shape = max(self._ps2D_shape)
+
+        # Log-space values used in fit_pspec and plot_fit
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self._log_freqs = np.log10(self._freqs.value)
+            self._log_ps1D = np.log10(self._ps1D)
+            self._log_err_frac = 0.434 * (self._ps1D_stddev / self._ps1D)
+
     def fit_pspec(self, brk=None, log_break=False, low_cut=None,
                   high_cut=None, min_fits_pts=10, weighted_fit=False,
                   bootstrap=False, bootstrap_kwargs={},
-                  verbose=False):
+                  verbose=False, use_fast_ols=True):
         '''
         Fit the 1D Power spectrum using a segmented linear model. Note that
         the current implementation allows for only 1 break point in the
@@ -146,6 +254,11 @@ class StatisticBase_PSpec2D(object):
             Pass keyword arguments to `~turbustat.statistics.fitting_utils.residual_bootstrap`.
         verbose : bool, optional
             Enables verbose mode in Lm_Seg.
+        use_fast_ols : bool, optional
+            Fit the model without a break using
+            `~turbustat.statistics.fitting_utils.fast_linear_fit` instead of
+            statsmodels. The statsmodels fit is always used when
+            `bootstrap=True`.
         '''
 
         self._bootstrap_flag = bootstrap
@@ -154,7 +267,7 @@ class StatisticBase_PSpec2D(object):
         if low_cut is None:
             # Default to the largest frequency, since this is just 1 pixel
             # in the 2D PSpec.
-            self.low_cut = 1. / (0.5 * float(max(self.ps2D.shape)) * u.pix)
+            self.low_cut = 1. / (0.5 * float(self._max_shape) * u.pix)
         else:
             self.low_cut = self._to_pixel_freq(low_cut)
 
@@ -163,23 +276,23 @@ class StatisticBase_PSpec2D(object):
         else:
             self.high_cut = self._to_pixel_freq(high_cut)
 
-        x = np.log10(self.freqs[clip_func(self.freqs.value, self.low_cut.value,
-                                          self.high_cut.value)].value)
-
-        clipped_ps1D = self.ps1D[clip_func(self.freqs.value,
-                                           self.low_cut.value,
-                                           self.high_cut.value)]
-        y = np.log10(clipped_ps1D)
+        # Compute the fit mask once. It is kept for plot_fit.
+        # Empty (NaN) or non-positive bins cannot be fit in log-space, so
+        # they are removed here rather than dropped in the model fit.
+        freqs_val = self.freqs.value
+        mask = clip_func(freqs_val, self.low_cut.value, self.high_cut.value)
+        mask &= self.ps1D > 0
 
         if weighted_fit:
+            mask &= self.ps1D_stddev > 0
 
-            clipped_stddev = self.ps1D_stddev[clip_func(self.freqs.value,
-                                                        self.low_cut.value,
-                                                        self.high_cut.value)]
+        self._fit_mask = mask
 
-            clipped_stddev[clipped_stddev == 0.] = np.NaN
+        x = self._log_freqs[mask]
+        y = self._log_ps1D[mask]
 
-            y_err = 0.434 * clipped_stddev / clipped_ps1D
+        if weighted_fit:
+            y_err = self._log_err_frac[mask]
 
         if brk is not None:
             # Try the fit with a break in it.
@@ -202,16 +315,19 @@ class StatisticBase_PSpec2D(object):
 
             if brk_fit.params.size == 5:
 
+                # The frequencies are sorted, so the points below the break
+                # are the first n_below.
+                n_below = np.searchsorted(x, brk_fit.brk)
+
                 # Check to make sure this leaves enough to fit to.
-                if sum(x < brk_fit.brk) < min_fits_pts:
+                if n_below < min_fits_pts:
                     warnings.warn("Not enough points to fit to." +
                                   " Ignoring break.")
 
                     self._brk = None
                 else:
-                    good_pts = x.copy() < brk_fit.brk
-                    x = x[good_pts]
-                    y = y[good_pts]
+                    x = x[:n_below]
+                    y = y[:n_below]
 
                     self._brk = 10**brk_fit.brk / u.pix
 
@@ -243,14 +359,22 @@ class StatisticBase_PSpec2D(object):
             self._brk_err = None
 
         if self.brk is None:
-            x = sm.add_constant(x)
-
             if weighted_fit:
-                model = sm.WLS(y, x, missing='drop', weights=1 / y_err**2)
+                weights = 1 / y_err**2
+            else:
+                weights = None
+
+            if use_fast_ols and not bootstrap:
+                self.fit = fast_linear_fit(x, y, weights=weights)
             else:
-                model = sm.OLS(y, x, missing='drop')
+                x = sm.add_constant(x)
 
-            self.fit = model.fit(cov_type='HC3')
+                if weighted_fit:
+                    model = sm.WLS(y, x, weights=weights)
+                else:
+                    model = sm.OLS(y, x)
+
+                self.fit = model.fit(cov_type='HC3')
 
             self._slope = self.fit.params[1]
 
@@ -293,12 +417,12 @@ class StatisticBase_PSpec2D(object):
     def apodizing_kernel(self, kernel_type="tukey", alpha=0.1, beta=0.0):
         '''
         Return an apodizing kernel to be applied to the image before taking
-        Fourier transform
+        Fourier transform. Kernels are cached by shape and shape parameters.
 
         Returns
         -------
         window : `~numpy.ndarray`
-            Apodizing kernel
+            Apodizing kernel. The array is read-only.
         '''
 
         if self.data is not None:
@@ -311,22 +435,7 @@ class StatisticBase_PSpec2D(object):
         if len(shape) > 2:
             shape = shape[1:]
 
-        avail_types = ['splitcosinebell', 'hanning', 'tukey',
-                       'cosinebell']
-
-        if kernel_type == "splitcosinebell":
-            return SplitCosineBellWindow(alpha, beta)(shape)
-        elif kernel_type == "hanning":
-            return HanningWindow()(shape)
-        elif kernel_type == "tukey":
-            return TukeyWindow(alpha)(shape)
-        elif kernel_type == 'cosinebell':
-            return CosineBellWindow(alpha)(shape)
-        else:
-            raise ValueError("kernel_type {0} is not one of the available "
-                             "types: {1}".format(kernel_type, avail_types))
-
-        return window
+        return _apod_kernel(tuple(shape), kernel_type, alpha, beta)
 
     def fit_2Dpspec(self, fit_method='LevMarq', p0=(), low_cut=None,
                     high_cut=None, bootstrap=True, niters=100,
@@ -611,21 +720,15 @@ class StatisticBase_PSpec2D(object):
             if hasattr(self, "_azim_mask"):
                 ax.contour(self._azim_mask, colors=[color], linestyles='--')
 
-        good_interval = clip_func(self.freqs.value, self.low_cut.value,
-                                  self.high_cut.value)
-
         y_fit = self.fit.fittedvalues
 
         if show_residual:
             if isinstance(self.slope, np.ndarray):
                 # Broken linear model
-                y_res = np.log10(self.ps1D) - \
-                    self._model.model(np.log10(self.freqs.value))
+                y_res = self._log_ps1D - self._model.model(self._log_freqs)
             else:
-                y_res = np.log10(self.ps1D) - \
-                    self.fit.predict(sm.add_constant(np.log10(self.freqs.value)))
-
-        fit_index = np.logical_and(np.isfinite(self.ps1D), good_interval)
+                y_res = self._log_ps1D - \
+                    self.fit.predict(sm.add_constant(self._log_freqs))
 
         # Set the x-values to use (freqs or k)
         if use_wavenumber:
@@ -634,52 +737,53 @@ class StatisticBase_PSpec2D(object):
             xvals = self.freqs
 
         xvals = self._spatial_freq_unit_conversion(xvals, xunit).value
+        log_xvals = np.log10(xvals)
 
         # Axis limits to highlight the fitted region
         vmax = 1.1 * \
             np.nanmax((self.ps1D + self.ps1D_stddev)
                       [self.freqs <= self.high_cut])
 
-        logyerrs = 0.434 * (self.ps1D_stddev / self.ps1D)
+        logyerrs = self._log_err_frac
 
         if fillin_errs:
             # Implementation by R. Boyden
-            ax_1D.fill_between(np.log10(xvals),
-                               np.log10(self.ps1D) - logyerrs,
-                               np.log10(self.ps1D) + logyerrs,
+            ax_1D.fill_between(log_xvals,
+                               self._log_ps1D - logyerrs,
+                               self._log_ps1D + logyerrs,
                                color=color,
                                alpha=0.5)
 
-            ax_1D.plot(np.log10(xvals), np.log10(self.ps1D), symbol,
+            ax_1D.plot(log_xvals, self._log_ps1D, symbol,
                        color=color, markersize=5, alpha=0.8)
 
             if show_residual:
-                ax_1D_res.fill_between(np.log10(xvals),
+                ax_1D_res.fill_between(log_xvals,
                                        y_res - logyerrs,
                                        y_res + logyerrs,
                                        color=color,
                                        alpha=0.5)
 
-                ax_1D_res.plot(np.log10(xvals), y_res,
+                ax_1D_res.plot(log_xvals, y_res,
                                symbol, color=color, markersize=5, alpha=0.8)
 
         else:
-            ax_1D.errorbar(np.log10(xvals),
-                           np.log10(self.ps1D),
+            ax_1D.errorbar(log_xvals,
+                           self._log_ps1D,
                            yerr=logyerrs,
                            color=color,
                            fmt=symbol, markersize=5, alpha=0.5, capsize=10,
                            elinewidth=3)
 
             if show_residual:
-                ax_1D_res.errorbar(np.log10(xvals),
+                ax_1D_res.errorbar(log_xvals,
                                    y_res,
                                    yerr=logyerrs,
                                    color=color,
                                    fmt=symbol, markersize=5, alpha=0.5,
                                    capsize=10, elinewidth=3)
 
-        ax_1D.plot(np.log10(xvals[fit_index]), y_fit, linestyle='-',
+        ax_1D.plot(log_xvals[self._fit_mask], y_fit, linestyle='-',
                    label=label, linewidth=3, color=fit_color)
 
         if show_residual:
@@ -698,9 +802,9 @@ class StatisticBase_PSpec2D(object):
         high_cut = \
             self._spatial_freq_unit_conversion(self.high_cut, xunit).value
         low_cut = low_cut if not use_wavenumber else \
-            low_cut * min(self._ps2D.shape)
+            low_cut * self._min_shape
         high_cut = high_cut if not use_wavenumber else \
-            high_cut * min(self._ps2D.shape)
+            high_cut * self._min_shape
         ax_1D.axvline(np.log10(low_cut), color=color, alpha=0.5,
                       linestyle='--')
         ax_1D.axvline(np.log10(high_cut), color=color, alpha=0.5,
@@ -47,6 +47,9 @@ class BaseStatisticMixIn(object):
 
         self._header = input_hdr
 
+        # Reset the pixel scale taken from the previous header
+        self._ang_size_cache = None
+
     def load_beam(self, beam=None):
         '''
         Try loading the beam from the header or a given object.
@@ -190,9 +193,16 @@ class BaseStatisticMixIn(object):
         if not hasattr(self, "_header"):
             raise AttributeError("No header has not been given.")
 
-        pix_scale = np.abs(proj_plane_pixel_scales(self._wcs)[0])
+        # Creating the WCS is slow and this is used in every unit
+        # conversion. Keep the pixel scale until a new header is set.
+        if getattr(self, "_ang_size_cache", None) is None:
+            wcs = self._wcs
+
+            pix_scale = np.abs(proj_plane_pixel_scales(wcs)[0])
 
-        return pix_scale * u.Unit(self._wcs.wcs.cunit[1])
+            self._ang_size_cache = pix_scale * u.Unit(wcs.wcs.cunit[1])
+
+        return self._ang_size_cache
 
     @property
     def distance(self):
@@ -267,6 +277,15 @@ class BaseStatisticMixIn(object):
         Converts from angular or physical frequencies to the pixel frequency.
         '''
 
+        if not isinstance(value, u.Quantity):
+            raise TypeError("value must be an astropy Quantity object.")
+
+        # Scale angular frequencies directly, instead of going through the
+        # equivalencies.
+        if value.unit.is_equivalent(u.deg**-1):
+            ang_size = self._ang_size
+            return value.to(ang_size.unit**-1).value * ang_size.value / u.pix
+
         return 1 / self._to_pixel(1 / value)
 
     def _to_pixel_area(self, value):
@@ -313,6 +313,203 @@ def clip_func(arr, low, high):
     return np.logical_and(arr > low, arr <= high)
 
 
+class LinearFitResults(object):
+    """
+    Minimal results container for a linear least-squares fit. Mirrors the
+    parts of the statsmodels results interface used in TurbuStat (`params`,
+    `bse`, `fittedvalues`, `predict` and `summary`). Any other attribute is
+    taken from the equivalent statsmodels fit, which is only created when
+    needed.
+
+    Parameters
+    ----------
+    y : `~numpy.ndarray`
+        y data.
+    exog : `~numpy.ndarray`
+        Design matrix, including the constant column.
+    params : `~numpy.ndarray`
+        Fit parameters.
+    bse : `~numpy.ndarray`
+        Standard errors of the fit parameters.
+    weights : `~numpy.ndarray`, optional
+        Weights used in the fit.
+    cov_type : str, optional
+        Covariance type used to compute `bse`.
+    """
+
+    def __init__(self, y, exog, params, bse, weights=None, cov_type='HC3'):
+        self._y = y
+        self._exog = exog
+        self._weights = weights
+        self._cov_type = cov_type
+
+        self.params = params
+        self.bse = bse
+
+    @property
+    def fittedvalues(self):
+        return self.predict(self._exog)
+
+    def predict(self, exog):
+        return np.dot(exog, self.params)
+
+    @property
+    def _sm_fit(self):
+        if not hasattr(self, "_sm_fit_cache"):
+            import statsmodels.api as sm
+
+            if self._weights is None:
+                model = sm.OLS(self._y, self._exog)
+            else:
+                model = sm.WLS(self._y, self._exog, weights=self._weights)
+
+            self._sm_fit_cache = model.fit(cov_type=self._cov_type)
+
+        return self._sm_fit_cache
+
+    def summary(self):
+        return self._sm_fit.summary()
+
+    def __getattr__(self, name):
+        # Avoid recursion when unpickling or copying
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        return getattr(self._sm_fit, name)
+
+
+def fast_linear_fit(x, y, weights=None):
+    '''
+    Fit a line with `~numpy.linalg.lstsq`. The standard errors use the
+    heteroscedasticity-consistent HC3 covariance, matching the statsmodels
+    fits with `cov_type='HC3'`, while avoiding the statsmodels overhead.
+
+    Parameters
+    ----------
+    x : `~numpy.ndarray`
+        x data.
+    y : `~numpy.ndarray`
+        y data.
+    weights : `~numpy.ndarray`, optional
+        Weights for a weighted least-squares fit.
+
+    Returns
+    -------
+    fit : `~turbustat.statistics.fitting_utils.LinearFitResults`
+        Fit results (intercept, slope).
+    '''
+
+    exog = np.column_stack([np.ones_like(x), x])
+
+    if weights is None:
+        wexog = exog
+        wy = y
+    else:
+        sqrt_w = np.sqrt(weights)
+        wexog = exog * sqrt_w[:, np.newaxis]
+        wy = y * sqrt_w
+
+    params = np.linalg.lstsq(wexog, wy, rcond=None)[0]
+
+    wresid = wy - np.dot(wexog, params)
+
+    # HC3 sandwich covariance
+    xtx_inv = np.linalg.inv(np.dot(wexog.T, wexog))
+    xtx_inv_x = np.dot(wexog, xtx_inv)
+    leverage = np.sum(xtx_inv_x * wexog, axis=1)
+    omega = (wresid / (1. - leverage))**2
+
+    cov = np.dot(xtx_inv_x.T * omega, xtx_inv_x)
+    bse = np.sqrt(np.diag(cov))
+
+    return LinearFitResults(y, exog, params, bse, weights=weights)
+
+
+def grid_break_search(x, y, weights=None, min_pts=3):
+    '''
+    Estimate a single break point by minimizing the sum of squared residuals
+    of two independent linear fits over a grid of candidate breaks at the
+    data points. Cumulative sums give every candidate's residuals in one
+    pass. The best candidate is refined with one iteration of Muggeo's
+    method (the update used in `~turbustat.statistics.lm_seg.Lm_Seg`).
+
+    Parameters
+    ----------
+    x : `~numpy.ndarray`
+        x data.
+    y : `~numpy.ndarray`
+        y data.
+    weights : `~numpy.ndarray`, optional
+        Weights for a weighted least-squares fit.
+    min_pts : int, optional
+        Minimum number of points on either side of a candidate break.
+
+    Returns
+    -------
+    brk : float
+        Estimated break point. When there are not enough points for two
+        segments, the break is placed half-way between the third-last and
+        last points.
+    '''
+
+    order = np.argsort(x)
+    x = np.asarray(x, dtype=float)[order]
+    y = np.asarray(y, dtype=float)[order]
+
+    if weights is None:
+        w = np.ones_like(x)
+    else:
+        w = np.asarray(weights, dtype=float)[order]
+
+    n = x.size
+    min_pts = max(int(min_pts), 2)
+
+    if n < 2 * min_pts:
+        return 0.5 * (x[-1] + x[-3])
+
+    # Cumulative weighted sums for the segment to the left of each split.
+    # The sums to the right are the totals minus these.
+    sums = np.cumsum(np.vstack([w, w * x, w * y, w * x * x, w * x * y,
+                                w * y * y]), axis=1)
+    left = sums[:, :-1]
+    right = sums[:, -1:] - left
+
+    def seg_sse(s):
+        sw, sx, sy, sxx, sxy, syy = s
+        cxx = sxx - sx**2 / sw
+        cxy = sxy - sx * sy / sw
+        cyy = syy - sy**2 / sw
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return cyy - np.where(cxx > 0, cxy**2 / cxx, 0.)
+
+    # Split index k puts x[:k] to the left and x[k:] to the right.
+    splits = np.arange(min_pts, n - min_pts + 1)
+
+    sse = seg_sse(left[:, splits - 1]) + seg_sse(right[:, splits - 1])
+
+    best = splits[np.nanargmin(sse)]
+    brk = x[best]
+
+    # Refine with one Muggeo step. Keep the grid value if the step leaves
+    # the range of the data.
+    U = (x - brk) * (x > brk)
+    V = -1. * (x >= brk)
+    exog = np.column_stack([np.ones_like(x), x, U, V])
+
+    sqrt_w = np.sqrt(w)
+    params = np.linalg.lstsq(exog * sqrt_w[:, np.newaxis], y * sqrt_w,
+                             rcond=None)[0]
+
+    beta, gamma = params[2], params[3]
+
+    if beta != 0.:
+        new_brk = brk + gamma / beta
+        if x[min_pts - 1] < new_brk < x[-min_pts]:
+            brk = new_brk
+
+    return brk
+
+
 def residual_bootstrap(fit_model, nboot=1000, seed=38574895,
                        return_samps=False, debug=False,
                        **fit_kwargs):
@@ -33,6 +33,20 @@ import numpy as np
 import warnings
 from copy import copy
 
+try:
+    from numba import njit
+    NUMBA_FLAG = True
+except ImportError:
+    NUMBA_FLAG = False
+
+    def njit(*args, **kwargs):
+        '''
+        Without numba, the functions are run as normal python functions.
+        '''
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 
 class Lm_Seg(object):
     """
@@ -72,6 +86,10 @@ class Lm_Seg(object):
     def fit_model(self, tol=1e-3, iter_max=100, h_step=2.0, epsil_0=10,
                   constant=True, verbose=True, missing='drop', **fit_kwargs):
         '''
+        Fit the segmented model. When `verbose` is disabled, the iterations
+        to find the break point use `_muggeo_iter`, which is compiled with
+        numba when it is installed. The statsmodels fits at each iteration
+        are only used in verbose mode.
         '''
         # Fit a normal linear model to the data
 
@@ -104,6 +122,78 @@ class Lm_Seg(object):
         # Catch cases where a break isn't necessary
         self.break_fail_flag = False
 
+        # The compiled loop does not handle missing values.
+        all_finite = np.isfinite(self.x).all() and np.isfinite(self.y).all()
+        if self.weights is not None:
+            all_finite = all_finite and np.isfinite(self.weights).all()
+
+        if not verbose and constant and all_finite:
+            if self.weights is None:
+                weights = np.ones(self.x.size)
+            else:
+                weights = np.asarray(self.weights, dtype=np.float64)
+
+            out = _muggeo_iter(np.asarray(self.x, dtype=np.float64),
+                               np.asarray(self.y, dtype=np.float64),
+                               weights, float(self.brk), float(h_step),
+                               float(epsil), float(tol), int(iter_max),
+                               float(dev_0))
+
+            self.brk, self.break_fail_flag, step_fail, max_iter_reached, \
+                dev_1, iter_cov = out
+
+            if step_fail:
+                warnings.warn("Cannot find good step-size, assuming\
+                               break not needed")
+            if max_iter_reached:
+                warnings.warn("Max iterations reached. \
+                               Result may not be minimized.")
+
+        else:
+            dev_1, iter_cov = self._fit_loop(epsil, dev_0, tol, iter_max,
+                                             h_step, constant, verbose,
+                                             missing)
+
+        # Is the initial model without a break better?
+        if self.break_fail_flag or np.sum(init_lm.resid**2) <= dev_1:
+            # If the initial fit was better, the segmented fit failed.
+            self.break_fail_flag = True
+
+            self.brk = self.x.max()
+
+            X_all = sm.add_constant(self.x)
+        else:
+            # With the break point hopefully found, do a final good fit
+            U = (self.x - self.brk) * (self.x > self.brk)
+            V = deriv_max(self.x, self.brk)
+
+            X_all = np.vstack([self.x, U, V]).T
+            X_all = sm.add_constant(X_all)
+
+        if self.weights is None:
+            model = sm.OLS(self.y, X_all, missing=missing)
+        else:
+            model = sm.WLS(self.y, X_all, weights=self.weights,
+                           missing=missing)
+
+        self.fit = model.fit()
+        self._params = self.fit.params
+        self._errs = self.fit.bse
+
+        if not self.break_fail_flag:
+            self.brk_err = brk_errs(self.params, iter_cov)
+        else:
+            self.brk_err = 0.0
+
+        self.get_slopes()
+
+    def _fit_loop(self, epsil, dev_0, tol, iter_max, h_step, constant,
+                  verbose, missing):
+        '''
+        Iterate on the break point with statsmodels fits. Returns the sum of
+        squared residuals and the covariance matrix of the last fit.
+        '''
+
         # Count
         it = 0
 
@@ -173,38 +263,7 @@ class Lm_Seg(object):
                                Result may not be minimized.")
                 break
 
-        # Is the initial model without a break better?
-        if self.break_fail_flag or np.sum(init_lm.resid**2) <= np.sum(fit.resid**2):
-            # If the initial fit was better, the segmented fit failed.
-            self.break_fail_flag = True
-
-            self.brk = self.x.max()
-
-            X_all = sm.add_constant(self.x)
-        else:
-            # With the break point hopefully found, do a final good fit
-            U = (self.x - self.brk) * (self.x > self.brk)
-            V = deriv_max(self.x, self.brk)
-
-            X_all = np.vstack([self.x, U, V]).T
-            X_all = sm.add_constant(X_all)
-
-        if self.weights is None:
-            model = sm.OLS(self.y, X_all, missing=missing)
-        else:
-            model = sm.WLS(self.y, X_all, weights=self.weights,
-                           missing=missing)
-
-        self.fit = model.fit()
-        self._params = self.fit.params
-        self._errs = self.fit.bse
-
-        if not self.break_fail_flag:
-            self.brk_err = brk_errs(self.params, fit.cov_params())
-        else:
-            self.brk_err = 0.0
-
-        self.get_slopes()
+        return np.sum(fit.resid**2), fit.cov_params()
 
     def model(self, x=None, model_return=False):
         p = self.params
@@ -274,6 +333,101 @@ class Lm_Seg(object):
         p.show()
 
 
+@njit(cache=True, error_model='numpy')
+def _muggeo_iter(x, y, weights, brk, h_step, epsil, tol, iter_max, dev_0):
+    '''
+    Muggeo's iterative procedure for the break point, using closed-form
+    weighted least-squares fits. This follows the loop in
+    `Lm_Seg.fit_model` exactly, with the fits to [1, x, U, V] solved
+    from the normal equations.
+
+    Returns
+    -------
+    brk : float
+        Break point.
+    break_fail : bool
+        No valid step-size could be found for the break point.
+    step_fail : bool
+        Same as `break_fail`. Separated for the warning.
+    max_iter_reached : bool
+        Maximum number of iterations reached.
+    dev : float
+        Sum of squared residuals of the last fit.
+    cov : np.ndarray
+        Covariance matrix of the last fit.
+    '''
+
+    n = x.size
+
+    X_all = np.empty((n, 4))
+    X_all[:, 0] = 1.
+    X_all[:, 1] = x
+
+    dev_1 = dev_0
+    cov = np.zeros((4, 4))
+
+    break_fail = False
+    step_fail = False
+    max_iter_reached = False
+
+    it = 0
+
+    while np.abs(epsil) > tol:
+        above = x > brk
+        X_all[:, 2] = (x - brk) * above
+        X_all[:, 3] = -1. * (x >= brk)
+
+        wX = X_all * weights.reshape((n, 1))
+        xtwx_inv = np.linalg.pinv(X_all.T.dot(wX))
+        params = xtwx_inv.dot(wX.T.dot(y))
+
+        beta = params[2]
+        gamma = params[3]
+
+        new_brk = brk + (h_step * gamma) / beta
+
+        n_above = np.sum(x > new_brk)
+        if n_above == 0 or n_above == n:
+            h_it = 0
+            while True:
+                new_brk -= (h_step * gamma) / beta
+                h_step /= 2.0
+                new_brk += (h_step * gamma) / beta
+                h_it += 1
+
+                n_above = np.sum(x > new_brk)
+                if n_above > 0 and n_above < n:
+                    brk = new_brk
+                    break
+                if h_it >= 5:
+                    break_fail = True
+                    step_fail = True
+                    it = iter_max + 1
+                    break
+        else:
+            brk = new_brk
+
+        resid = y - X_all.dot(params)
+
+        dev_1 = np.sum(resid**2)
+
+        # Non-robust covariance, as from statsmodels' default fit
+        scale = np.sum(weights * resid**2) / (n - 4)
+        cov = xtwx_inv * scale
+
+        epsil = (dev_1 - dev_0) / (dev_0 + 1e-3)
+
+        dev_0 = dev_1
+
+        it += 1
+
+        if it > iter_max:
+            max_iter_reached = True
+            break
+
+    return brk, break_fail, step_fail, max_iter_reached, dev_1, cov
+
+
 def deriv_max(a, b, pow=1):
     if pow == 1:
         dum = -1 * np.ones(a.shape)
@@ -13,7 +13,7 @@ if sys.version_info[0] >= 3:
 else:
     import cPickle as pickle
 
-from ..base_pspec2 import StatisticBase_PSpec2D
+from ..base_pspec2 import StatisticBase_PSpec2D, _apply_apod_kernel
 from ..base_statistic import BaseStatisticMixIn
 from ...io import input_data, common_types, twod_types
 from ..fitting_utils import check_fit_limits
@@ -159,8 +159,12 @@ class MVC(BaseStatisticMixIn, StatisticBase_PSpec2D):
             apod_kernel = self.apodizing_kernel(kernel_type=apodize_kernel,
                                                 alpha=alpha,
                                                 beta=beta)
-            term1_data = self.centroid * self.moment0 * apod_kernel
-            term2_data = self.linewidth**2 + self.centroid**2 * apod_kernel
+            # Apply the kernel to the products in place to avoid
+            # another temporary array for each term.
+            term1_data = _apply_apod_kernel(self.centroid * self.moment0,
+                                            apod_kernel)
+            term2_data = _apply_apod_kernel(self.centroid**2, apod_kernel)
+            term2_data += self.linewidth**2
             mom0_data = self.moment0 * apod_kernel
 
         else:
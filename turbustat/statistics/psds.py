@@ -6,14 +6,17 @@ from scipy.stats import binned_statistic
 import astropy.units as u
 from astropy.coordinates import Angle
 from scipy.stats import t as t_dist
+from functools import lru_cache
 
 
 def pspec(psd2, nbins=None, return_stddev=False, binsize=1.0,
           logspacing=True, max_bin=None, min_bin=None, return_freqs=True,
           theta_0=None, delta_theta=None, boot_iter=None,
-          mean_func=np.nanmean):
+          mean_func=np.nanmean, rfft_shape=None):
     '''
-    Calculate the radial profile using scipy.stats.binned_statistic.
+    Calculate the radial profile. The default mean and standard deviation
+    are computed with `np.bincount`. `scipy.stats.binned_statistic` is used
+    for a custom `mean_func` or bootstrapped standard deviations.
 
     Parameters
     ----------
@@ -46,6 +49,12 @@ def pspec(psd2, nbins=None, return_stddev=False, binsize=1.0,
     mean_func : function, optional
         Define the function used to create the 1D power spectrum. The default
         is `np.nanmean`.
+    rfft_shape : tuple, optional
+        Shape of the full power spectrum when `psd2` is the (unshifted)
+        half-plane from a real FFT. Each pixel is weighted by the number of
+        times it appears in the full, Hermitian-symmetric spectrum. Azimuthal
+        masks, bootstrapping, a custom `mean_func` and `return_freqs=False`
+        are not supported for the half-plane.
 
     Returns
     -------
@@ -58,10 +67,26 @@ def pspec(psd2, nbins=None, return_stddev=False, binsize=1.0,
         within each of the bins.
     '''
 
-    yy, xx = make_radial_arrays(psd2.shape)
+    # The bincount sums would otherwise carry the units through
+    if isinstance(psd2, u.Quantity):
+        psd2 = psd2.value
+
+    if rfft_shape is not None:
+        if theta_0 is not None or boot_iter is not None or \
+                mean_func is not np.nanmean or not return_freqs:
+            raise ValueError("Azimuthal masks, bootstrapping, mean_func and "
+                             "return_freqs=False cannot be used with a "
+                             "half-plane power spectrum.")
+
+        shape = tuple(rfft_shape)
+    else:
+        shape = psd2.shape
+
+    # Largest pixel distance from the centre of the full spectrum
+    max_dist = np.sqrt((shape[0] // 2)**2 + (shape[1] // 2)**2)
 
-    dists = np.sqrt(yy**2 + xx**2)
     if theta_0 is not None:
+        yy, xx = make_radial_arrays(shape)
 
         if delta_theta is None:
             raise ValueError("Must give delta_theta.")
@@ -79,37 +104,21 @@ def pspec(psd2, nbins=None, return_stddev=False, binsize=1.0,
         theta_limits = theta_limits.wrap_at(np.pi * u.rad)
 
     if nbins is None:
-        nbins = int(np.round(dists.max() / binsize) + 1)
-
-    if return_freqs:
-        yy_freq, xx_freq = make_radial_freq_arrays(psd2.shape)
-
-        freqs_dist = np.sqrt(yy_freq**2 + xx_freq**2)
-
-        zero_freq_val = freqs_dist[np.nonzero(freqs_dist)].min() / 2.
-        freqs_dist[freqs_dist == 0] = zero_freq_val
+        nbins = int(np.round(max_dist / binsize) + 1)
 
     if max_bin is None:
         if return_freqs:
             max_bin = 0.5
         else:
-            max_bin = dists.max()
+            max_bin = max_dist
 
     if min_bin is None:
         if return_freqs:
-            min_bin = 1.0 / min(psd2.shape)
+            min_bin = 1.0 / min(shape)
         else:
             min_bin = 0.5
 
-    if logspacing:
-        bins = np.logspace(np.log10(min_bin), np.log10(max_bin), nbins + 1)
-    else:
-        bins = np.linspace(min_bin, max_bin, nbins + 1)
-
-    if return_freqs:
-        dist_arr = freqs_dist
-    else:
-        dist_arr = dists
+    bins = _make_bins(nbins, logspacing, min_bin, max_bin)
 
     if theta_0 is not None:
         if theta_limits[0] < theta_limits[1]:
@@ -133,12 +142,52 @@ def pspec(psd2, nbins=None, return_stddev=False, binsize=1.0,
     if azim_mask is not None:
         finite_mask = np.logical_and(finite_mask, azim_mask)
 
-    ps1D, bin_edge, cts = binned_statistic(dist_arr[finite_mask].ravel(),
-                                           psd2[finite_mask].ravel(),
-                                           bins=bins,
-                                           statistic=mean_func)
+    all_finite = finite_mask.all()
 
-    bin_cents = (bin_edge[1:] + bin_edge[:-1]) / 2.
+    bin_cents = (bins[1:] + bins[:-1]) / 2.
+
+    if mean_func is np.nanmean:
+        # The bin indices depend only on the shape and binning, so they are
+        # cached for repeated spectra. Points outside of the bins are
+        # assigned to an extra bin at the end, which is dropped.
+        bin_idx, bin_cts = _radial_index(shape, nbins, logspacing,
+                                         min_bin, max_bin, return_freqs,
+                                         rfft_shape is not None)
+
+        if rfft_shape is not None:
+            # Number of times each pixel appears in the full spectrum.
+            mult = rfft_multiplicity(shape)
+        else:
+            mult = None
+
+        if all_finite:
+            bin_idx = bin_idx.ravel()
+            bin_vals = psd2.ravel()
+            if mult is not None:
+                mult = mult.ravel()
+        else:
+            bin_idx = bin_idx[finite_mask]
+            bin_vals = psd2[finite_mask]
+            if mult is not None:
+                mult = mult[finite_mask]
+
+            bin_cts = np.bincount(bin_idx, weights=mult,
+                                  minlength=nbins + 1)[:nbins]
+
+        wvals = bin_vals if mult is None else mult * bin_vals
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ps1D = np.bincount(bin_idx, weights=wvals,
+                               minlength=nbins + 1)[:nbins] / bin_cts
+
+    if mean_func is not np.nanmean or \
+            (return_stddev and boot_iter is not None):
+        dist_arr = _radial_dists(shape, return_freqs)[finite_mask]
+        psd2 = psd2[finite_mask]
+
+    if mean_func is not np.nanmean:
+        ps1D = binned_statistic(dist_arr, psd2, bins=bins,
+                                statistic=mean_func)[0]
 
     if not return_stddev:
         if theta_0 is not None:
@@ -147,27 +196,43 @@ def pspec(psd2, nbins=None, return_stddev=False, binsize=1.0,
             return bin_cents, ps1D
     else:
 
-        if boot_iter is None:
+        if boot_iter is None and mean_func is np.nanmean:
+
+            # Two passes for numerical stability: the squared residuals
+            # about the bin means.
+            sq_resid = (bin_vals - np.append(ps1D, 0.)[bin_idx])**2
+            if mult is not None:
+                sq_resid *= mult
 
-            stat_func = lambda x: np.nanstd(x, ddof=1)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                ps1D_stddev = \
+                    np.sqrt(np.bincount(bin_idx, weights=sq_resid,
+                                        minlength=nbins + 1)[:nbins] /
+                            (bin_cts - 1))
 
         else:
-            from astropy.stats import bootstrap
 
-            stat_func = lambda data: np.mean(bootstrap(data, boot_iter,
-                                                       bootfunc=np.std))
+            if boot_iter is None:
 
-        ps1D_stddev = binned_statistic(dist_arr[finite_mask].ravel(),
-                                       psd2[finite_mask].ravel(),
-                                       bins=bins,
-                                       statistic=stat_func)[0]
+                stat_func = lambda x: np.nanstd(x, ddof=1)
+
+            else:
+                from astropy.stats import bootstrap
+
+                stat_func = lambda data: np.mean(bootstrap(data, boot_iter,
+                                                           bootfunc=np.std))
+
+            ps1D_stddev = binned_statistic(dist_arr, psd2,
+                                           bins=bins,
+                                           statistic=stat_func)[0]
+
+            if mean_func is not np.nanmean:
+                bin_cts = binned_statistic(dist_arr, psd2,
+                                           bins=bins,
+                                           statistic='count')[0]
 
         # We're dealing with variations in the number of samples for each bin.
         # Add a correction based on the t distribution
-        bin_cts = binned_statistic(dist_arr[finite_mask].ravel(),
-                                   psd2[finite_mask].ravel(),
-                                   bins=bins,
-                                   statistic='count')[0]
 
         # Two-tail CI for 85% (~1 sigma)
         alpha = 1 - (0.15 / 2.)
@@ -193,6 +258,127 @@ def pspec(psd2, nbins=None, return_stddev=False, binsize=1.0,
             return bin_cents, ps1D, ps1D_stddev
 
 
+def _make_bins(nbins, logspacing, min_bin, max_bin):
+    '''
+    Bin edges for the radial profile.
+    '''
+
+    if logspacing:
+        return np.logspace(np.log10(min_bin), np.log10(max_bin), nbins + 1)
+
+    return np.linspace(min_bin, max_bin, nbins + 1)
+
+
+def _radial_dists(shape, return_freqs=True, rfft=False):
+    '''
+    Radial spatial frequencies (or pixel distances when `return_freqs` is
+    disabled) of each pixel in the power spectrum. The zero frequency is
+    set to half of the smallest non-zero frequency. `rfft` gives the
+    frequencies in the unshifted half-plane layout of a real FFT.
+    '''
+
+    if not return_freqs:
+        yy, xx = make_radial_arrays(shape)
+
+        return np.sqrt(yy**2 + xx**2)
+
+    if rfft:
+        yy_freq, xx_freq = make_rfft_radial_freq_arrays(shape)
+    else:
+        yy_freq, xx_freq = make_radial_freq_arrays(shape)
+
+    freqs_dist = np.sqrt(yy_freq**2 + xx_freq**2)
+
+    zero_freq_val = freqs_dist[np.nonzero(freqs_dist)].min() / 2.
+    freqs_dist[freqs_dist == 0] = zero_freq_val
+
+    return freqs_dist
+
+
+@lru_cache(maxsize=8)
+def _radial_index(shape, nbins, logspacing, min_bin, max_bin,
+                  return_freqs=True, rfft=False):
+    '''
+    Cached radial bin index of each pixel and the number of pixels in each
+    bin. Pixels outside of the bins are given an index of `nbins`. The
+    returned arrays are read-only.
+    '''
+
+    bins = _make_bins(nbins, logspacing, min_bin, max_bin)
+
+    dist_arr = _radial_dists(shape, return_freqs, rfft)
+
+    bin_idx, in_bins = _radial_bin_index(dist_arr, bins, logspacing)
+    bin_idx[~in_bins] = nbins
+
+    if rfft:
+        mult = rfft_multiplicity(shape).ravel()
+    else:
+        mult = None
+
+    bin_cts = np.bincount(bin_idx.ravel(), weights=mult,
+                          minlength=nbins + 1)[:nbins]
+
+    bin_idx.flags.writeable = False
+    bin_cts.flags.writeable = False
+
+    return bin_idx, bin_cts
+
+
+def _radial_bin_index(dist_arr, bins, logspacing):
+    '''
+    Assign each distance to a bin. The bins are uniform in linear or log
+    space, so the index is found by scaling the distances rather than with a
+    search over the bin edges. The index is then corrected by one bin where
+    rounding places a point on the wrong side of an edge, which gives the
+    same assignments as `scipy.stats.binned_statistic`: the right-most edge
+    is included in the last bin.
+
+    Returns
+    -------
+    bin_idx : np.ndarray
+        Bin index of each distance.
+    in_bins : np.ndarray
+        Mask of distances that fall within the bins.
+    '''
+
+    nbins = bins.size - 1
+
+    if logspacing:
+        scaled = (np.log10(dist_arr) - np.log10(bins[0])) * \
+            (nbins / (np.log10(bins[-1]) - np.log10(bins[0])))
+    else:
+        scaled = (dist_arr - bins[0]) * (nbins / (bins[-1] - bins[0]))
+
+    bin_idx = np.floor(scaled).astype(np.intp)
+    bin_idx.clip(0, nbins - 1, out=bin_idx)
+
+    bin_idx -= dist_arr < bins[bin_idx]
+    bin_idx += dist_arr >= bins[bin_idx + 1]
+
+    bin_idx[dist_arr == bins[-1]] = nbins - 1
+
+    in_bins = np.logical_and(bin_idx >= 0, bin_idx < nbins)
+
+    return bin_idx, in_bins
+
+
+def rfft_multiplicity(shape):
+    '''
+    Number of times each pixel in the (unshifted) half-plane of a real FFT
+    appears in the full FFT of an array with the given shape. Only the zero
+    and (for even sizes) Nyquist frequencies along the last axis are not
+    mirrored.
+    '''
+
+    mult = np.full(shape[-1] // 2 + 1, 2.)
+    mult[0] = 1.
+    if shape[-1] % 2 == 0:
+        mult[-1] = 1.
+
+    return np.broadcast_to(mult, (shape[0], mult.size))
+
+
 def make_radial_arrays(shape, y_center=None, x_center=None):
 
     if y_center is None:
@@ -221,3 +407,17 @@ def make_radial_freq_arrays(shape):
     yy_freq, xx_freq = np.meshgrid(yfreqs, xfreqs, indexing='ij')
 
     return yy_freq[::-1], xx_freq[::-1]
+
+
+def make_rfft_radial_freq_arrays(shape):
+    '''
+    Frequencies in the (unshifted) half-plane layout of a real FFT for an
+    array with the given shape.
+    '''
+
+    yfreqs = np.fft.fftfreq(shape[0])
+    xfreqs = np.fft.rfftfreq(shape[1])
+
+    yy_freq, xx_freq = np.meshgrid(yfreqs, xfreqs, indexing='ij')
+
+    return yy_freq, xx_freq
@@ -6,8 +6,9 @@ from numpy.fft import fftshift
 import astropy.units as u
 from warnings import warn
 from copy import copy
+from concurrent.futures import ThreadPoolExecutor
 
-from ..rfft_to_fft import rfft_to_fft
+from ..rfft_to_fft import rfft_to_fft, expand_rfft
 from ..base_pspec2 import StatisticBase_PSpec2D
 from ..base_statistic import BaseStatisticMixIn
 from ...io import common_types, twod_types
@@ -31,35 +32,42 @@ class PowerSpectrum(BaseStatisticMixIn, StatisticBase_PSpec2D):
         Physical distance to the region in the data.
     beam : `radio_beam.Beam`, optional
         Beam object for correcting for the effect of a finite beam.
+    dtype : `~numpy.dtype`, optional
+        Convert the image to this type before computing the power spectrum
+        (e.g., `np.float32` to halve the memory use). The input type is
+        kept by default.
     """
 
     __doc__ %= {"dtypes": " or ".join(common_types + twod_types)}
 
     def __init__(self, img, header=None, weights=None, distance=None,
-                 beam=None):
+                 beam=None, dtype=None):
         super(PowerSpectrum, self).__init__()
 
         # Set data and header
         # Need to make a copy if there are NaNs
         self.input_data_header(img, header, need_copy=False)
 
+        if dtype is not None:
+            self.data = self.data.astype(dtype, copy=False)
+
+            if weights is not None:
+                weights = np.asarray(weights, dtype=dtype)
+
         if np.isnan(self.data).any():
-            self.data = self.data.copy()
-            self.data[np.isnan(self.data)] = 0.0
+            self.data = np.nan_to_num(self.data)
 
         if weights is None:
-            weights = np.ones(self.data.shape)
+            # Unit weights would only copy the data.
+            self.weighted_data = self.data
         else:
-            # Get rid of all NaNs
-            isnan = np.isnan(self.data)
-
-            weights[np.isnan(weights)] = 0.0
-            weights[isnan] = 0.0
-            self.data[isnan] = 0.0
-
-        self.weighted_data = self.data * weights
+            # Blanked data are already zero, so only NaN weights remain to be
+            # removed from the product.
+            self.weighted_data = np.nan_to_num(self.data * weights,
+                                               copy=False)
 
         self._ps1D_stddev = None
+        self._ps2D_full = None
 
         self.load_beam(beam=beam)
 
@@ -99,24 +107,46 @@ class PowerSpectrum(BaseStatisticMixIn, StatisticBase_PSpec2D):
             apod_kernel = self.apodizing_kernel(kernel_type=apodize_kernel,
                                                 alpha=alpha,
                                                 beta=beta)
-            data = self.weighted_data * apod_kernel
+            # Keep a float32 image from being promoted by the kernel.
+            dtype = np.result_type(self.weighted_data.dtype, np.float32)
+            data = np.multiply(self.weighted_data, apod_kernel, dtype=dtype)
         else:
             data = self.weighted_data
 
         if pyfftw_kwargs.get('threads') is not None:
             pyfftw_kwargs.pop('threads')
 
-        fft = fftshift(rfft_to_fft(data, use_pyfftw=use_pyfftw,
-                                   threads=threads,
-                                   **pyfftw_kwargs))
+        # Only the half-plane from the real FFT is kept. The full spectrum
+        # is built from it when `ps2D` is accessed.
+        fft = rfft_to_fft(data, keep_rfft=True, use_pyfftw=use_pyfftw,
+                          threads=threads, **pyfftw_kwargs)
 
-        self._ps2D = np.power(fft, 2.)
+        self._fft_shape = data.shape
+        self._ps2D_full = None
 
-        if beam_correct:
-            self.compute_beam_pspec()
+        # rfft_to_fft returns |F|, so square in place to get |F|^2
+        self._ps2D_rfft = np.square(fft, out=fft)
 
         if beam_correct:
-            self._ps2D /= self._beam_pow
+            self.compute_beam_pspec(keep_rfft=True)
+
+            self._ps2D_rfft /= self._beam_pow
+
+    @property
+    def _ps2D(self):
+        '''
+        Full, shifted 2D power spectrum. Built from the half-plane on first
+        access.
+        '''
+        if self._ps2D_full is None:
+            self._ps2D_full = \
+                fftshift(expand_rfft(self._ps2D_rfft, self._fft_shape[-1]))
+
+        return self._ps2D_full
+
+    @property
+    def _ps2D_shape(self):
+        return self._fft_shape
 
     def run(self, verbose=False, beam_correct=False,
             apodize_kernel=None, alpha=0.2, beta=0.0,
@@ -242,6 +272,10 @@ class PSpec_Distance(object):
     pspec2_kwargs : dict or None, optional
         Passed to `radial_pspec_kwargs` in `~PowerSpectrum.run` for `data2`.
         When `None` is given, setting from `pspec_kwargs` are used for `data2`.
+    parallel : bool, optional
+        Compute the two power spectra at the same time in separate threads.
+        The spectra are computed one after the other when plotting is
+        enabled in the keyword arguments.
     """
 
     __doc__ %= {"dtypes": " or ".join(common_types + twod_types)}
@@ -249,7 +283,7 @@ class PSpec_Distance(object):
     def __init__(self, data1, data2, weights1=None, weights2=None,
                  breaks=None, low_cut=None,
                  high_cut=0.5 / u.pix, pspec_kwargs={},
-                 pspec2_kwargs=None):
+                 pspec2_kwargs=None, parallel=True):
 
         low_cut, high_cut = check_fit_limits(low_cut, high_cut)
 
@@ -259,6 +293,9 @@ class PSpec_Distance(object):
         if pspec2_kwargs is None:
             pspec2_kwargs = pspec_kwargs
 
+        # Spectra to compute, with the keyword arguments for run
+        runs = []
+
         # if fiducial_model is None:
         if isinstance(data1, PowerSpectrum):
             self.pspec1 = data1
@@ -281,10 +318,11 @@ class PSpec_Distance(object):
             if 'fit_kwargs' in this_pspec_kwargs:
                 this_pspec_kwargs['fit_kwargs'].pop('brk', None)
 
-            self.pspec1.run(low_cut=low_cut[0], high_cut=high_cut[0],
-                            fit_kwargs={'brk': breaks[0]},
-                            fit_2D=False,
-                            **this_pspec_kwargs)
+            runs.append((self.pspec1,
+                         dict(low_cut=low_cut[0], high_cut=high_cut[0],
+                              fit_kwargs={'brk': breaks[0]},
+                              fit_2D=False,
+                              **this_pspec_kwargs)))
         # else:
         #     self.pspec1 = fiducial_model
         if isinstance(data2, PowerSpectrum):
@@ -309,10 +347,27 @@ class PSpec_Distance(object):
             if 'fit_kwargs' in this_pspec2_kwargs:
                 this_pspec2_kwargs['fit_kwargs'].pop('brk', None)
 
-            self.pspec2.run(low_cut=low_cut[1], high_cut=high_cut[1],
-                            fit_kwargs={'brk': breaks[1]},
-                            fit_2D=False,
-                            **this_pspec2_kwargs)
+            runs.append((self.pspec2,
+                         dict(low_cut=low_cut[1], high_cut=high_cut[1],
+                              fit_kwargs={'brk': breaks[1]},
+                              fit_2D=False,
+                              **this_pspec2_kwargs)))
+
+        # The spectra are independent, and the FFTs release the GIL.
+        # Plotting is not thread-safe, so keep the runs serial when enabled.
+        use_threads = parallel and len(runs) == 2 and \
+            self.pspec1 is not self.pspec2 and \
+            not any(kwargs.get('verbose') for _, kwargs in runs)
+
+        if use_threads:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [executor.submit(pspec.run, **kwargs)
+                           for pspec, kwargs in runs]
+                for future in futures:
+                    future.result()
+        else:
+            for pspec, kwargs in runs:
+                pspec.run(**kwargs)
 
         self.results = None
         self.distance = None
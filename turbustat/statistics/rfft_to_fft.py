@@ -2,11 +2,17 @@
 from __future__ import print_function, absolute_import, division
 
 import numpy as np
+import os
 from warnings import warn
 
 try:
+    import pyfftw
     from pyfftw.interfaces.numpy_fft import rfftn
     PYFFTW_FLAG = True
+
+    # Keep the FFTW plans between calls, so repeated transforms of the
+    # same shape (e.g., in the distance metrics) skip the planning step.
+    pyfftw.interfaces.cache.enable()
 except ImportError:
     PYFFTW_FLAG = False
 
@@ -35,8 +41,11 @@ def rfft_to_fft(image, keep_rfft=False, use_pyfftw=False,
     use_pyfftw : bool, optional
         Try using pyfftw for the FFT.
     threads : int, optional
-        Number of threads to use when using pyfftw. Default is 1.
+        Number of threads to use when using pyfftw. Default is 1. When
+        None, all available CPUs are used.
     pyfftw_kwargs : Passed to `~pyfftw.interfaces.numpy_fft.rfftn`.
+        e.g., `planner_effort='FFTW_MEASURE'` gives faster transforms when
+        the same shape is transformed many times.
 
     Outputs
     -------
@@ -52,7 +61,10 @@ def rfft_to_fft(image, keep_rfft=False, use_pyfftw=False,
 
     if use_pyfftw:
         if PYFFTW_FLAG:
-            fft_abs = np.abs(rfftn(image, **pyfftw_kwargs))
+            if threads is None:
+                threads = os.cpu_count()
+
+            fft_abs = np.abs(rfftn(image, threads=threads, **pyfftw_kwargs))
         else:
             use_pyfftw = False
             warn("pyfftw is not installed")
@@ -63,6 +75,29 @@ def rfft_to_fft(image, keep_rfft=False, use_pyfftw=False,
     if keep_rfft:
         return fft_abs
 
+    return expand_rfft(fft_abs, last_dim)
+
+
+def expand_rfft(fft_abs, last_dim):
+    '''
+    Expand the absolute value (or any real function of it) of the RFFT output
+    to the negative frequencies of the full FFT.
+
+    Inputs
+    ------
+    fft_abs : numpy.ndarray
+        2 or 3D real half-plane array from `rfft_to_fft` with
+        `keep_rfft=True`.
+    last_dim : int
+        Size of the last dimension of the image that was transformed.
+
+    Outputs
+    -------
+    fft_abs : the array expanded to the full FFT shape.
+    '''
+
+    ndim = len(fft_abs.shape)
+
     if ndim == 2:
         if last_dim % 2 == 0:
             fftstar_abs = fft_abs.copy()[:, -2:0:-1]
@@ -83,3 +118,6 @@ def rfft_to_fft(image, keep_rfft=False, use_pyfftw=False,
         fftstar_abs[:, 1::, :] = fftstar_abs[:, :0:-1, :]
 
         return np.concatenate((fft_abs, fftstar_abs), axis=2)
+
+    else:
+        raise TypeError("Dimension of fft_abs must be 2D or 3D.")
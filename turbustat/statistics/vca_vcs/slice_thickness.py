@@ -104,12 +104,17 @@ def spectral_regrid_cube(cube, channel_width, method='downsample',
                  " width.")
 
             # Sample the closest integer to the given width
-            orig_width = np.abs(np.diff(cube.spectral_axis[:2])[0])
+            spec_unit = cube.spectral_axis.unit
 
             if channel_width.unit.is_equivalent(u.pix):
                 channel_width = int((np.ceil(channel_width.value)))
-            elif channel_width.unit.is_equivalent(cube.spectral_axis.unit):
-                channel_width = int((np.ceil(channel_width / orig_width)).value)
+            elif channel_width.unit.is_equivalent(spec_unit):
+                spec_vals = cube.spectral_axis.value
+                orig_width = np.abs(spec_vals[1] - spec_vals[0])
+
+                channel_width = \
+                    int(np.ceil(channel_width.to(spec_unit).value /
+                                orig_width))
             else:
                 raise u.UnitsError("channel_width must be given in pixel units"
                                    " or the same spectral unit as the cube.")
@@ -128,16 +133,20 @@ def spectral_regrid_cube(cube, channel_width, method='downsample',
 
         pix_unit = channel_width.unit.is_equivalent(u.pix)
 
-        spec_width = np.diff(cube.spectral_axis[:2])[0]
+        # The spectral axis is computed from the WCS on each access. Get it
+        # once and work with floats in the cube's spectral unit.
+        spec_axis = cube.spectral_axis
+        spec_unit = spec_axis.unit
+        spec_vals = spec_axis.value
 
-        current_resolution = np.diff(cube.spectral_axis[:2])[0]
+        current_resolution = spec_vals[1] - spec_vals[0]
 
         if pix_unit:
-            target_resolution = channel_width.value * spec_width
+            target_resolution = channel_width.value * current_resolution
         else:
-            target_resolution = channel_width.to(current_resolution.unit)
+            target_resolution = channel_width.to(spec_unit).value
 
-        diff_factor = np.abs(target_resolution / current_resolution).value
+        diff_factor = np.abs(target_resolution / current_resolution)
 
         if diff_factor == 1:
             warn("The requested channel width match the original channel "
@@ -149,23 +158,29 @@ def spectral_regrid_cube(cube, channel_width, method='downsample',
                              " supported. The requested channel width of {0}"
                              " is a factor {1} "
                              "smaller than the original channel width."
-                             .format(target_resolution, diff_factor))
+                             .format(target_resolution * spec_unit,
+                                     diff_factor))
 
         pixel_scale = np.abs(current_resolution)
 
         gaussian_width = ((target_resolution**2 - current_resolution**2)**0.5 /
                           pixel_scale / fwhm_factor)
-        kernel = Gaussian1DKernel(gaussian_width.value)
-        new_cube = cube.spectral_smooth(kernel)
+
+        # A kernel this narrow leaves the spectra unchanged, so only
+        # interpolate onto the new grid.
+        if gaussian_width < 0.1:
+            new_cube = cube
+        else:
+            kernel = Gaussian1DKernel(gaussian_width)
+            new_cube = cube.spectral_smooth(kernel)
 
         # Now define the new spectral axis at the new resolution
         num_chan = int(np.floor_divide(cube.shape[0], diff_factor))
-        new_specaxis = np.linspace(cube.spectral_axis.min().value,
-                                   cube.spectral_axis.max().value,
-                                   num_chan) * current_resolution.unit
+        new_specaxis = np.linspace(spec_vals.min(), spec_vals.max(),
+                                   num_chan) * spec_unit
 
         # Keep the same order (max to min or min to max)
-        if current_resolution.value < 0:
+        if current_resolution < 0:
             new_specaxis = new_specaxis[::-1]
 
         return new_cube.spectral_interpolate(new_specaxis,
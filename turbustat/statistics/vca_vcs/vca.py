@@ -115,7 +115,7 @@ class VCA(BaseStatisticMixIn, StatisticBase_PSpec2D):
                                    threads=threads,
                                    **pyfftw_kwargs))
 
-        self._ps2D = np.power(fft, 2.).sum(axis=0)
+        self._ps2D = np.square(fft, out=fft).sum(axis=0)
 
         if beam_correct:
             self.compute_beam_pspec()
@@ -10,7 +10,8 @@ from ..lm_seg import Lm_Seg
 from ..rfft_to_fft import rfft_to_fft
 from ..base_statistic import BaseStatisticMixIn
 from ...io import common_types, threed_types
-from ..fitting_utils import clip_func, residual_bootstrap
+from ..fitting_utils import (clip_func, residual_bootstrap,
+                             grid_break_search)
 
 
 class VCS(BaseStatisticMixIn):
@@ -90,7 +91,7 @@ class VCS(BaseStatisticMixIn):
 
     def fit_pspec(self, breaks=None, log_break=True, low_cut=None,
                   high_cut=None, fit_verbose=False, bootstrap=False,
-                  **bootstrap_kwargs):
+                  grid_search=False, **bootstrap_kwargs):
         '''
         Fit the 1D Power spectrum using a segmented linear model. Note that
         the current implementation allows for only 1 break point in the
@@ -103,7 +104,8 @@ class VCS(BaseStatisticMixIn):
             Guesses for the break points. If given as a list, the length of
             the list sets the number of break points to be fit. If a choice is
             outside of the allowed range from the data, Lm_Seg will raise an
-            error. If None, a spline is used to estimate the breaks.
+            error. If None, a spline is used to estimate the breaks, or
+            a grid search when `grid_search` is enabled.
         log_break : bool, optional
             Sets whether the provided break estimates are log-ed values.
         low_cut : `~astropy.units.Quantity`, optional
@@ -115,6 +117,10 @@ class VCS(BaseStatisticMixIn):
         bootstrap : bool, optional
             Bootstrap using the model residuals to estimate the standard
             errors.
+        grid_search : bool, optional
+            When `breaks` is None, estimate a single break with
+            `~turbustat.statistics.fitting_utils.grid_break_search` instead
+            of testing the breaks from a spline.
         bootstrap_kwargs : dict, optional
             Pass keyword arguments to `~turbustat.statistics.fitting_utils.residual_bootstrap`.
         '''
@@ -147,7 +153,18 @@ class VCS(BaseStatisticMixIn):
         x = np.log10(rfreqs[clip_func(rfreqs, self.low_cut.value,
                                       self.high_cut.value)])
 
-        if breaks is None:
+        if breaks is None and grid_search:
+
+            if x.size <= 3 or y.size <= 3:
+                raise Warning("There are no points to fit to. Try lowering "
+                              "'lg_scale_cut'.")
+
+            breaks = grid_break_search(x, y)
+
+            if fit_verbose:
+                print("Break found from grid search is: " + str(breaks))
+
+        elif breaks is None:
             from scipy.interpolate import UnivariateSpline
 
             # Need to order the points
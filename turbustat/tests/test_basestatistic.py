@@ -40,6 +40,40 @@ def test_angles():
     obj._angular_equiv
 
 
+def test_ang_size_new_header():
+    '''
+    The cached pixel scale should be updated with a new header.
+    '''
+
+    obj = BaseStatisticMixIn()
+
+    obj.header = header
+
+    ang_size = obj._ang_size
+
+    new_header = header.copy()
+    new_header['CDELT2'] *= 2
+    new_header['CDELT1'] *= 2
+
+    obj.header = new_header
+
+    assert_allclose(obj._ang_size, 2 * ang_size)
+
+
+def test_to_pixel_freq():
+
+    obj = BaseStatisticMixIn()
+
+    obj.header = header
+
+    freq = 0.1 / u.arcmin
+
+    pix_freq = obj._to_pixel_freq(freq)
+
+    assert pix_freq.unit == u.pix**-1
+    assert_allclose(pix_freq, 1 / obj._to_pixel(1 / freq))
+
+
 def test_distance():
 
     obj = BaseStatisticMixIn()
@@ -8,6 +8,7 @@ from astropy.utils.misc import NumpyRNGContext
 
 
 from ..statistics.lm_seg import Lm_Seg
+from ..statistics.fitting_utils import grid_break_search
 
 
 def test_lmseg():
@@ -37,3 +38,40 @@ def test_lmseg_weighted():
 
     npt.assert_approx_equal(5.0, model.brk, significant=2)
     npt.assert_allclose([2.0, 5.0], model.slopes, rtol=0.1)
+
+
+@pytest.mark.parametrize('weighted', [False, True])
+def test_lmseg_fast_iter(weighted):
+    '''
+    The compiled break-point iterations should match the statsmodels loop.
+    '''
+    x = np.linspace(0, 10, 200)
+
+    with NumpyRNGContext(12129):
+        yerr = np.random.normal(0, 0.1, 200)
+        y = 2 + 2 * x * (x < 5) + (5 * x - 15) * (x >= 5) + \
+            yerr
+
+    weights = yerr**-2 if weighted else None
+
+    model = Lm_Seg(x, y, 3, weights=weights)
+    model.fit_model(tol=1e-3, verbose=True)
+
+    model_fast = Lm_Seg(x, y, 3, weights=weights)
+    model_fast.fit_model(tol=1e-3, verbose=False)
+
+    npt.assert_allclose(model.brk, model_fast.brk)
+    npt.assert_allclose(model.params, model_fast.params)
+    npt.assert_allclose(model.brk_err, model_fast.brk_err)
+
+
+@pytest.mark.parametrize('brk', [2.5, 5., 7.5])
+def test_grid_break_search(brk):
+    x = np.linspace(0, 10, 200)
+
+    with NumpyRNGContext(12129):
+        y = 2 + 2 * x * (x < brk) + (5 * x - 3 * brk) * (x >= brk) + \
+            np.random.normal(0, 0.1, 200)
+
+    npt.assert_allclose(brk, grid_break_search(x, y, min_pts=10),
+                        atol=0.05)
@@ -7,6 +7,7 @@ import numpy.testing as npt
 import astropy.units as u
 from astropy.io import fits
 from astropy.convolution import convolve_fft
+from astropy.utils.misc import NumpyRNGContext
 import os
 
 try:
@@ -111,6 +112,16 @@ def test_PSpec_distance():
     npt.assert_almost_equal(tester_dist3.distance,
                             computed_distances['pspec_distance'])
 
+    # Computing the spectra serially
+    tester_dist4 = \
+        PSpec_Distance(dataset1["moment0"],
+                       dataset2["moment0"],
+                       parallel=False)
+    tester_dist4.distance_metric(verbose=False)
+
+    npt.assert_almost_equal(tester_dist4.distance,
+                            computed_distances['pspec_distance'])
+
 
 def test_pspec_nonequal_shape():
 
@@ -124,6 +135,27 @@ def test_pspec_nonequal_shape():
     npt.assert_almost_equal(test.slope2D, test_T.slope2D, decimal=3)
 
 
+def test_pspec_nan_weights():
+
+    mom0 = dataset1["moment0"][0].copy()
+    mom0_hdr = dataset1["moment0"][1]
+
+    mom0[:2] = np.NaN
+
+    weights = np.ones_like(mom0)
+    weights[-2:] = np.NaN
+
+    test = PowerSpectrum((mom0, mom0_hdr), weights=weights)
+
+    assert np.isfinite(test.weighted_data).all()
+    npt.assert_equal(test.weighted_data[:2], 0.)
+    npt.assert_equal(test.weighted_data[-2:], 0.)
+    npt.assert_equal(test.weighted_data[2:-2], mom0[2:-2])
+
+    # The inputs should not be altered.
+    assert np.isnan(mom0[:2]).all()
+    assert np.isnan(weights[-2:]).all()
+
 @pytest.mark.parametrize(('plaw', 'ellip'),
                          [(plaw, ellip) for plaw in [3, 4]
                           for ellip in [0.2, 0.5, 0.75, 0.9, 1.0]])
@@ -296,3 +328,61 @@ def test_PSpec_apod_kernel(apod_type):
              low_cut=low_cut, verbose=False)
 
     npt.assert_allclose(-plaw, test.slope, rtol=0.02)
+
+
+@pytest.mark.parametrize('weighted_fit', [False, True])
+def test_pspec_fast_ols(weighted_fit):
+    '''
+    The lstsq fit should match the statsmodels fit.
+    '''
+
+    tester = PowerSpectrum(dataset1["moment0"])
+    tester.run(fit_2D=False,
+               fit_kwargs={'weighted_fit': weighted_fit,
+                           'use_fast_ols': False})
+
+    slope = tester.slope
+    slope_err = tester.slope_err
+
+    tester.fit_pspec(weighted_fit=weighted_fit, use_fast_ols=True)
+
+    npt.assert_allclose(tester.slope, slope)
+    npt.assert_allclose(tester.slope_err, slope_err)
+
+
+def test_pspec_float32():
+
+    tester = PowerSpectrum(dataset1["moment0"])
+    tester.run(fit_2D=False, apodize_kernel='tukey')
+
+    tester_32 = PowerSpectrum(dataset1["moment0"], dtype=np.float32)
+    tester_32.run(fit_2D=False, apodize_kernel='tukey')
+
+    assert tester_32.weighted_data.dtype == np.float32
+
+    npt.assert_allclose(tester.ps1D, tester_32.ps1D, rtol=1e-4)
+    npt.assert_allclose(tester.slope, tester_32.slope, rtol=1e-5)
+
+
+def test_pspec_brk():
+    '''
+    White noise added to a power-law image flattens the spectrum at high
+    frequencies.
+    '''
+
+    img = make_extended(128, powerlaw=4., randomseed=54321)
+
+    with NumpyRNGContext(12129):
+        img += np.random.normal(0, 0.1 * img.std(), img.shape)
+
+    test = PowerSpectrum(fits.PrimaryHDU(img))
+    test.run(fit_2D=False, fit_kwargs={'brk': 0.1 / u.pix})
+
+    assert test.brk is not None
+    assert test.slope.size == 2
+    npt.assert_allclose(-4., test.slope[0], atol=0.3)
+
+    # Too few points below the break to keep it
+    test.fit_pspec(brk=0.1 / u.pix, min_fits_pts=60)
+
+    assert test.brk is None
@@ -47,3 +47,15 @@ def test_fftw():
 
     npt.assert_allclose(test_fft, comp_rfft_fftw)
     npt.assert_allclose(comp_rfft, comp_rfft_fftw)
+
+
+@pytest.mark.skipif("not PYFFTW_INSTALLED")
+def test_fftw_threads():
+    comp_rfft = rfft_to_fft(dataset1['moment0'][0])
+
+    # Repeat to use the cached plan
+    for _ in range(2):
+        comp_rfft_fftw = rfft_to_fft(dataset1['moment0'][0], use_pyfftw=True,
+                                     threads=None)
+
+        npt.assert_allclose(comp_rfft, comp_rfft_fftw)
@@ -166,6 +166,21 @@ def test_spectral_regrid(regrid_type, channel_width):
                         atol=0.2)
 
 
+def test_spectral_regrid_nosmooth():
+    '''
+    A small change in the channel width should only interpolate.
+    '''
+
+    sc_cube = to_spectral_cube(*dataset1['cube'])
+
+    sc_regrid = spectral_regrid_cube(sc_cube, 1.001 * u.pix,
+                                     method='regrid')
+
+    sc_interp = sc_cube.spectral_interpolate(sc_regrid.spectral_axis,
+                                             suppress_smooth_warning=True)
+
+    npt.assert_allclose(sc_regrid.filled_data[:], sc_interp.filled_data[:])
+
 @pytest.mark.parametrize(('plaw', 'ellip'),
                          [(plaw, ellip) for plaw in [3, 4]
                           for ellip in [0.2, 0.5, 0.75, 0.9, 1.0]])
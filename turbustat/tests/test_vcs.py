@@ -103,6 +103,18 @@ def test_VCS_method_fitlimits():
     npt.assert_allclose(tester.slope, tester2.slope, atol=0.02)
 
 
+
+def test_VCS_grid_search():
+    tester = VCS(dataset1["cube"])
+    tester.run(high_cut=0.3 / u.pix, low_cut=3e-2 / u.pix)
+
+    tester_grid = VCS(dataset1["cube"])
+    tester_grid.run(high_cut=0.3 / u.pix, low_cut=3e-2 / u.pix,
+                    grid_search=True)
+
+    npt.assert_allclose(tester.brk, tester_grid.brk, rtol=0.01)
+    npt.assert_allclose(tester.slope, tester_grid.slope, rtol=0.01)
+
 @pytest.mark.skipif("not PYFFTW_INSTALLED")
 def test_VCS_method_fftw():
     tester = VCS(dataset1["cube"]).run(high_cut=0.3 / u.pix,